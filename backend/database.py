@@ -1,4 +1,5 @@
 import aiosqlite
+import asyncio
 import os
 from datetime import date, datetime
 from typing import Optional
@@ -33,129 +34,204 @@ EV_MODELS = [
 ]
 
 
+# SQL statements, kept as module constants so every call reuses the same
+# string and hits the shared connection's prepared-statement cache
+_SQL_SEED_MODEL = "INSERT OR IGNORE INTO models (make, model) VALUES (?, ?)"
+_SQL_SEED_SETTING = "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)"
+_SQL_GET_MODELS = "SELECT id, make, model FROM models ORDER BY make, model"
+
+_SQL_GET_PRICE_HISTORY = """
+    SELECT date, avg_price, min_price, max_price, listing_count, avg_mileage
+    FROM price_history
+    WHERE model_id = ?
+    ORDER BY date DESC
+    LIMIT ?
+"""
+
+# Column order of the listings SELECT, zipped with each row to build the response
+LISTING_COLUMNS = (
+    "id", "source", "external_id", "year", "price", "mileage", "location", "url", "scraped_at"
+)
+
+# One listings query per (sort_by, sort_order) combination accepted by the API
+_SQL_GET_LISTINGS = {
+    (sort_by, sort_order): f"""
+        SELECT id, source, external_id, year, price, mileage, location, url, scraped_at
+        FROM listings
+        WHERE model_id = ?
+        ORDER BY {sort_by} {sort_order.upper()}
+        LIMIT ? OFFSET ?
+    """
+    for sort_by in ("price", "mileage", "year", "scraped_at")
+    for sort_order in ("asc", "desc")
+}
+
+_SQL_REFRESH_MODEL_STATS = """
+    INSERT OR REPLACE INTO model_stats (model_id, avg_price, count, last_scrape)
+    SELECT model_id, AVG(price), COUNT(*), MAX(scraped_at)
+    FROM listings
+    WHERE price > 0
+    GROUP BY model_id
+"""
+
+_SQL_GET_STATS_TOTALS = """
+    SELECT
+        SUM(count) as total_listings,
+        COUNT(*) as models_with_data,
+        SUM(avg_price * count) / SUM(count) as avg_price,
+        MAX(last_scrape) as last_scrape
+    FROM model_stats
+"""
+
+_SQL_GET_CHEAPEST_MODELS = """
+    SELECT model_id, avg_price, count
+    FROM model_stats
+    ORDER BY avg_price ASC
+    LIMIT 5
+"""
+
+_SQL_INSERT_LISTING = """
+    INSERT OR REPLACE INTO listings
+    (model_id, source, external_id, year, price, mileage, location, url, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_PRICE_HISTORY = """
+    INSERT OR REPLACE INTO price_history
+    (model_id, date, avg_price, min_price, max_price, listing_count, avg_mileage)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_SETTINGS = "SELECT key, value FROM settings"
+_SQL_SET_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+
+
+# Shared connection, opened once in init_db() and reused by every helper
+_db: Optional[aiosqlite.Connection] = None
+
+# Models are seeded once from EV_MODELS and never change, so serve them from memory
+MODELS_BY_ID: dict[int, dict] = {}
+MODELS_LIST: list[dict] = []
+
+# Serializes all writes on the shared connection; reads stay lock-free under WAL
+_write_lock = asyncio.Lock()
+
+
 async def get_db():
-    """Get database connection."""
-    db = await aiosqlite.connect(DB_PATH)
-    db.row_factory = aiosqlite.Row
-    return db
+    """Get the shared database connection."""
+    return _db
 
 
 async def init_db():
-    """Initialize database schema and seed data."""
-    db = await get_db()
-    try:
-        # Create tables
-        await db.executescript("""
-            CREATE TABLE IF NOT EXISTS models (
-                id INTEGER PRIMARY KEY,
-                make TEXT NOT NULL,
-                model TEXT NOT NULL,
-                UNIQUE(make, model)
-            );
-
-            CREATE TABLE IF NOT EXISTS listings (
-                id INTEGER PRIMARY KEY,
-                model_id INTEGER REFERENCES models(id),
-                source TEXT NOT NULL,
-                external_id TEXT,
-                year INTEGER,
-                price INTEGER,
-                mileage INTEGER,
-                location TEXT,
-                url TEXT,
-                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(source, external_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS price_history (
-                id INTEGER PRIMARY KEY,
-                model_id INTEGER REFERENCES models(id),
-                date DATE NOT NULL,
-                avg_price INTEGER,
-                min_price INTEGER,
-                max_price INTEGER,
-                listing_count INTEGER,
-                avg_mileage INTEGER,
-                UNIQUE(model_id, date)
-            );
-
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_listings_model_id ON listings(model_id);
-            CREATE INDEX IF NOT EXISTS idx_listings_scraped_at ON listings(scraped_at);
-            CREATE INDEX IF NOT EXISTS idx_price_history_model_date ON price_history(model_id, date);
-        """)
-
+    """Open the shared connection, initialize database schema and seed data."""
+    global _db
+    _db = await aiosqlite.connect(DB_PATH)
+    _db.row_factory = aiosqlite.Row
+    db = _db
+
+    # WAL lets API reads proceed while the scraper writes
+    await db.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA busy_timeout=5000;
+        PRAGMA mmap_size=268435456;
+    """)
+
+    # Create tables
+    await db.executescript("""
+        CREATE TABLE IF NOT EXISTS models (
+            id INTEGER PRIMARY KEY,
+            make TEXT NOT NULL,
+            model TEXT NOT NULL,
+            UNIQUE(make, model)
+        );
+
+        CREATE TABLE IF NOT EXISTS listings (
+            id INTEGER PRIMARY KEY,
+            model_id INTEGER REFERENCES models(id),
+            source TEXT NOT NULL,
+            external_id TEXT,
+            year INTEGER,
+            price INTEGER,
+            mileage INTEGER,
+            location TEXT,
+            url TEXT,
+            scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(source, external_id)
+        );
+
+        CREATE TABLE IF NOT EXISTS price_history (
+            id INTEGER PRIMARY KEY,
+            model_id INTEGER REFERENCES models(id),
+            date DATE NOT NULL,
+            avg_price INTEGER,
+            min_price INTEGER,
+            max_price INTEGER,
+            listing_count INTEGER,
+            avg_mileage INTEGER,
+            UNIQUE(model_id, date)
+        );
+
+        CREATE TABLE IF NOT EXISTS model_stats (
+            model_id INTEGER PRIMARY KEY REFERENCES models(id),
+            avg_price INTEGER,
+            count INTEGER,
+            last_scrape TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_listings_model_id ON listings(model_id);
+        CREATE INDEX IF NOT EXISTS idx_listings_scraped_at ON listings(scraped_at);
+        CREATE INDEX IF NOT EXISTS idx_listings_model_price ON listings(model_id, price);
+        CREATE INDEX IF NOT EXISTS idx_listings_model_mileage ON listings(model_id, mileage);
+        CREATE INDEX IF NOT EXISTS idx_listings_model_year ON listings(model_id, year);
+        CREATE INDEX IF NOT EXISTS idx_listings_model_scraped_at ON listings(model_id, scraped_at);
+        CREATE INDEX IF NOT EXISTS idx_price_history_model_date ON price_history(model_id, date);
+    """)
+
+    async with _write_lock:
         # Seed EV models
         for make, model in EV_MODELS:
-            await db.execute(
-                "INSERT OR IGNORE INTO models (make, model) VALUES (?, ?)",
-                (make, model)
-            )
+            await db.execute(_SQL_SEED_MODEL, (make, model))
 
         # Set default settings (Houston, TX area with 200 mile radius)
-        await db.execute(
-            "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
-            ("zip_code", "77001")
-        )
-        await db.execute(
-            "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
-            ("search_radius", "200")
-        )
+        await db.execute(_SQL_SEED_SETTING, ("zip_code", "77001"))
+        await db.execute(_SQL_SEED_SETTING, ("search_radius", "200"))
 
         await db.commit()
-    finally:
-        await db.close()
+
+    # Load the models table into memory
+    cursor = await db.execute(_SQL_GET_MODELS)
+    rows = await cursor.fetchall()
+    MODELS_LIST[:] = [dict(row) for row in rows]
+    MODELS_BY_ID.clear()
+    MODELS_BY_ID.update({model["id"]: model for model in MODELS_LIST})
+
+    await refresh_model_stats()
 
 
 async def get_all_models():
     """Get all tracked EV models."""
-    db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT id, make, model FROM models ORDER BY make, model"
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
-    finally:
-        await db.close()
+    return MODELS_LIST
 
 
 async def get_model_by_id(model_id: int):
     """Get a specific model by ID."""
-    db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT id, make, model FROM models WHERE id = ?",
-            (model_id,)
-        )
-        row = await cursor.fetchone()
-        return dict(row) if row else None
-    finally:
-        await db.close()
+    return MODELS_BY_ID.get(model_id)
 
 
 async def get_price_history(model_id: int, days: int = 90):
     """Get price history for a model."""
     db = await get_db()
-    try:
-        cursor = await db.execute(
-            """
-            SELECT date, avg_price, min_price, max_price, listing_count, avg_mileage
-            FROM price_history
-            WHERE model_id = ?
-            ORDER BY date DESC
-            LIMIT ?
-            """,
-            (model_id, days)
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in reversed(rows)]
-    finally:
-        await db.close()
+    cursor = await db.execute(_SQL_GET_PRICE_HISTORY, (model_id, days))
+    rows = await cursor.fetchall()
+    return [dict(row) for row in reversed(rows)]
 
 
 async def get_listings(
@@ -167,165 +243,121 @@ async def get_listings(
 ):
     """Get current listings for a model."""
     db = await get_db()
-    try:
-        valid_sort_columns = {"price", "mileage", "year", "scraped_at"}
-        if sort_by not in valid_sort_columns:
-            sort_by = "price"
-        order = "ASC" if sort_order.lower() == "asc" else "DESC"
-
-        cursor = await db.execute(
-            f"""
-            SELECT id, source, external_id, year, price, mileage, location, url, scraped_at
-            FROM listings
-            WHERE model_id = ?
-            ORDER BY {sort_by} {order}
-            LIMIT ? OFFSET ?
-            """,
-            (model_id, limit, offset)
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
-    finally:
-        await db.close()
+    cursor = await db.execute(
+        _SQL_GET_LISTINGS[(sort_by, sort_order)],
+        (model_id, limit, offset)
+    )
+    rows = await cursor.fetchall()
+    return [dict(zip(LISTING_COLUMNS, row)) for row in rows]
+
+
+async def refresh_model_stats():
+    """Recompute the per-model roll-up used by the dashboard."""
+    db = await get_db()
+    async with _write_lock:
+        # A single upsert, so readers never see a half-refreshed roll-up
+        await db.execute(_SQL_REFRESH_MODEL_STATS)
+        await db.commit()
 
 
 async def get_stats():
     """Get dashboard summary statistics."""
     db = await get_db()
-    try:
-        # Total listings
-        cursor = await db.execute("SELECT COUNT(*) as count FROM listings")
-        row = await cursor.fetchone()
-        total_listings = row["count"]
-
-        # Models with data
-        cursor = await db.execute(
-            "SELECT COUNT(DISTINCT model_id) as count FROM listings"
-        )
-        row = await cursor.fetchone()
-        models_with_data = row["count"]
 
-        # Average price across all listings
-        cursor = await db.execute(
-            "SELECT AVG(price) as avg_price FROM listings WHERE price > 0"
-        )
-        row = await cursor.fetchone()
-        avg_price = int(row["avg_price"]) if row["avg_price"] else 0
-
-        # Last scrape time
-        cursor = await db.execute(
-            "SELECT MAX(scraped_at) as last_scrape FROM listings"
-        )
-        row = await cursor.fetchone()
-        last_scrape = row["last_scrape"]
-
-        # Top 5 cheapest models (by average price)
-        cursor = await db.execute(
-            """
-            SELECT m.make, m.model, AVG(l.price) as avg_price, COUNT(*) as count
-            FROM listings l
-            JOIN models m ON l.model_id = m.id
-            WHERE l.price > 0
-            GROUP BY l.model_id
-            ORDER BY avg_price ASC
-            LIMIT 5
-            """
-        )
-        rows = await cursor.fetchall()
-        cheapest_models = [
-            {
-                "make": row["make"],
-                "model": row["model"],
-                "avg_price": int(row["avg_price"]),
-                "count": row["count"]
-            }
-            for row in rows
-        ]
-
-        return {
-            "total_listings": total_listings,
-            "models_with_data": models_with_data,
-            "avg_price": avg_price,
-            "last_scrape": last_scrape,
-            "cheapest_models": cheapest_models
+    # Totals across the per-model roll-up
+    cursor = await db.execute(_SQL_GET_STATS_TOTALS)
+    row = await cursor.fetchone()
+
+    # Top 5 cheapest models (by average price)
+    cursor = await db.execute(_SQL_GET_CHEAPEST_MODELS)
+    rows = await cursor.fetchall()
+    cheapest_models = [
+        {
+            "make": MODELS_BY_ID[r["model_id"]]["make"],
+            "model": MODELS_BY_ID[r["model_id"]]["model"],
+            "avg_price": int(r["avg_price"]),
+            "count": r["count"]
         }
-    finally:
-        await db.close()
-
-
-async def save_listing(
-    model_id: int,
-    source: str,
-    external_id: str,
-    year: Optional[int],
-    price: int,
-    mileage: Optional[int],
-    location: Optional[str],
-    url: str
-):
-    """Save a scraped listing."""
+        for r in rows
+        if r["model_id"] in MODELS_BY_ID
+    ]
+
+    return {
+        "total_listings": row["total_listings"] or 0,
+        "models_with_data": row["models_with_data"],
+        "avg_price": int(row["avg_price"]) if row["avg_price"] else 0,
+        "last_scrape": row["last_scrape"],
+        "cheapest_models": cheapest_models
+    }
+
+
+async def save_listings_bulk(rows: list[tuple]):
+    """Save a batch of scraped listings in a single transaction.
+
+    Each row is (model_id, source, external_id, year, price, mileage, location, url).
+    """
+    if not rows:
+        return
     db = await get_db()
-    try:
-        await db.execute(
-            """
-            INSERT OR REPLACE INTO listings
-            (model_id, source, external_id, year, price, mileage, location, url, scraped_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (model_id, source, external_id, year, price, mileage, location, url, datetime.utcnow())
-        )
-        await db.commit()
-    finally:
-        await db.close()
+    async with _write_lock:
+        scraped_at = datetime.utcnow()
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            await db.executemany(
+                _SQL_INSERT_LISTING,
+                [(*row, scraped_at) for row in rows]
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
 
+async def update_price_history(model_id: int, prices: list[int], mileages: list[Optional[int]]):
+    """Update price history aggregates for a model from a freshly scraped batch."""
+    prices = [p for p in prices if p > 0]
+    if not prices:
+        return
+    known_mileages = [m for m in mileages if m]
+    avg_mileage = sum(known_mileages) // len(known_mileages) if known_mileages else None
 
-async def update_price_history(model_id: int):
-    """Update price history aggregates for a model."""
     db = await get_db()
-    try:
+    async with _write_lock:
         today = date.today().isoformat()
         await db.execute(
-            """
-            INSERT OR REPLACE INTO price_history
-            (model_id, date, avg_price, min_price, max_price, listing_count, avg_mileage)
-            SELECT
+            _SQL_UPSERT_PRICE_HISTORY,
+            (
                 model_id,
-                ?,
-                AVG(price),
-                MIN(price),
-                MAX(price),
-                COUNT(*),
-                AVG(mileage)
-            FROM listings
-            WHERE model_id = ? AND price > 0
-            GROUP BY model_id
-            """,
-            (today, model_id)
+                today,
+                sum(prices) // len(prices),
+                min(prices),
+                max(prices),
+                len(prices),
+                avg_mileage
+            )
         )
         await db.commit()
-    finally:
-        await db.close()
 
 
 async def get_settings():
     """Get all settings."""
     db = await get_db()
-    try:
-        cursor = await db.execute("SELECT key, value FROM settings")
-        rows = await cursor.fetchall()
-        return {row["key"]: row["value"] for row in rows}
-    finally:
-        await db.close()
+    cursor = await db.execute(_SQL_GET_SETTINGS)
+    rows = await cursor.fetchall()
+    return {row["key"]: row["value"] for row in rows}
 
 
 async def update_setting(key: str, value: str):
     """Update a setting."""
     db = await get_db()
-    try:
-        await db.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-            (key, value)
-        )
+    async with _write_lock:
+        await db.execute(_SQL_SET_SETTING, (key, value))
         await db.commit()
-    finally:
-        await db.close()
+
+
+async def close_db():
+    """Close the shared database connection."""
+    global _db
+    if _db is not None:
+        await _db.close()
+        _db = None
@@ -1,13 +1,18 @@
 import asyncio
-from contextlib import asynccontextmanager
-from typing import Optional
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Literal, Optional
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+import orjson
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from database import (
+    MODELS_LIST,
     init_db,
+    close_db,
     get_all_models,
     get_model_by_id,
     get_price_history,
@@ -15,10 +20,18 @@ from database import (
     get_stats,
     get_settings,
     update_setting,
-    save_listing,
+    save_listings_bulk,
     update_price_history,
+    refresh_model_stats,
+)
+from scraper import (
+    CarGurusScraper,
+    AutotraderScraper,
+    CarsComScraper,
+    ScraperPool,
+    close_browser,
+    close_http_client,
 )
-from scraper import CarGurusScraper, AutotraderScraper, CarsComScraper
 
 
 # Track scraping state
@@ -31,17 +44,35 @@ scrape_status = {
 }
 
 
+# Pre-encoded JSON responses: {key: (expires_at, body)}
+_cache: dict[str, tuple[float, bytes]] = {}
+
+
+async def cached_json(key: str, ttl: float, producer) -> Response:
+    """Serve a cached JSON response, calling producer() to rebuild it once expired."""
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is None or entry[0] <= now:
+        entry = (now + ttl, orjson.dumps(await producer()))
+        _cache[key] = entry
+    return Response(content=entry[1], media_type="application/json")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database on startup; close scraper clients and database on shutdown."""
     await init_db()
     yield
+    await close_http_client()
+    await close_browser()
+    await close_db()
 
 
 app = FastAPI(
     title="EV Price Tracker API",
     description="Track used EV prices across multiple listing sites",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -63,8 +94,11 @@ class SettingsUpdate(BaseModel):
 @app.get("/api/models")
 async def list_models():
     """Get all tracked EV models."""
-    models = await get_all_models()
-    return {"models": models}
+    async def producer():
+        return {"models": await get_all_models()}
+
+    # The models table never changes, so this never expires
+    return await cached_json("models", float("inf"), producer)
 
 
 @app.get("/api/models/{model_id}")
@@ -95,8 +129,8 @@ async def get_model_listings(
     model_id: int,
     limit: int = 50,
     offset: int = 0,
-    sort_by: str = "price",
-    sort_order: str = "asc"
+    sort_by: Literal["price", "mileage", "year", "scraped_at"] = "price",
+    sort_order: Literal["asc", "desc"] = "asc"
 ):
     """Get current listings for a model."""
     model = await get_model_by_id(model_id)
@@ -115,8 +149,7 @@ async def get_model_listings(
 @app.get("/api/stats")
 async def get_dashboard_stats():
     """Get dashboard summary statistics."""
-    stats = await get_stats()
-    return stats
+    return await cached_json("stats", 30, get_stats)
 
 
 @app.get("/api/settings")
@@ -142,7 +175,61 @@ async def get_scrape_status():
     return scrape_status
 
 
-async def run_scrape(model_ids: list[int] = None):
+# Maximum number of scrapes (browser contexts) in flight at once, per source
+SCRAPE_CONCURRENCY = 4
+
+
+async def _scrape_model(model: dict, pools: dict[str, ScraperPool], force_refresh: bool):
+    """Scrape every source for one model and record its price history."""
+    model_id = model["id"]
+    make = model["make"]
+    model_name = model["model"]
+    model_listings = []
+    scraped_fresh = False
+
+    for source_name, pool in pools.items():
+        try:
+            async with pool.acquire() as scraper:
+                # Only name the model once it is actually being scraped
+                scrape_status["current_model"] = f"{make} {model_name}"
+                listings, from_cache = await scraper.scrape(make, model_name, force_refresh)
+            # Cached listings were saved by the scrape that cached them; re-saving
+            # would stamp them with a scraped_at for a scrape that never ran
+            if not from_cache:
+                await save_listings_bulk([
+                    (
+                        model_id,
+                        source_name,
+                        listing.external_id,
+                        listing.year,
+                        listing.price,
+                        listing.mileage,
+                        listing.location,
+                        listing.url
+                    )
+                    for listing in listings
+                ])
+                scraped_fresh = True
+            model_listings.extend(listings)
+        except Exception as e:
+            error_msg = f"Error scraping {make} {model_name} from {source_name}: {str(e)}"
+            print(error_msg)
+            scrape_status["errors"].append(error_msg)
+
+        scrape_status["progress"] += 1
+        await asyncio.sleep(0.1)  # Small delay between sources
+
+    # Update price history after scraping all sources for this model, unless
+    # every source was served from the cache and nothing new was recorded
+    if scraped_fresh:
+        await update_price_history(
+            model_id,
+            [listing.price for listing in model_listings],
+            [listing.mileage for listing in model_listings]
+        )
+
+
+async def run_scrape(model_ids: list[int] = None, force_refresh: bool = False):
     """Run scraping for specified models or all models."""
     global scrape_status
 
@@ -157,9 +244,11 @@ async def run_scrape(model_ids: list[int] = None):
         zip_code = settings.get("zip_code", "90210")
         radius = int(settings.get("search_radius", "100"))
 
-        models = await get_all_models()
         if model_ids:
-            models = [m for m in models if m["id"] in model_ids]
+            ids = frozenset(model_ids)
+            models = [m for m in MODELS_LIST if m["id"] in ids]
+        else:
+            models = MODELS_LIST
 
         # Only using Cars.com for now (most reliable)
         scrapers = [
@@ -169,36 +258,28 @@ async def run_scrape(model_ids: list[int] = None):
         scrape_status["total"] = len(models) * len(scrapers)
         scrape_status["progress"] = 0
 
-        for model in models:
-            model_id = model["id"]
-            make = model["make"]
-            model_name = model["model"]
-            scrape_status["current_model"] = f"{make} {model_name}"
-
-            for ScraperClass, source_name in scrapers:
-                try:
-                    async with ScraperClass(zip_code=zip_code, radius=radius) as scraper:
-                        async for listing in scraper.scrape_listings(make, model_name):
-                            await save_listing(
-                                model_id=model_id,
-                                source=source_name,
-                                external_id=listing.external_id,
-                                year=listing.year,
-                                price=listing.price,
-                                mileage=listing.mileage,
-                                location=listing.location,
-                                url=listing.url
-                            )
-                except Exception as e:
-                    error_msg = f"Error scraping {make} {model_name} from {source_name}: {str(e)}"
-                    print(error_msg)
-                    scrape_status["errors"].append(error_msg)
-
-                scrape_status["progress"] += 1
-                await asyncio.sleep(0.1)  # Small delay between sources
-
-            # Update price history after scraping all sources for this model
-            await update_price_history(model_id)
+        # Scrape models concurrently over a pool of reusable scrapers per source
+        async with AsyncExitStack() as stack:
+            pools = {
+                source_name: await stack.enter_async_context(
+                    ScraperPool(ScraperClass, zip_code, radius, SCRAPE_CONCURRENCY)
+                )
+                for ScraperClass, source_name in scrapers
+            }
+
+            results = await asyncio.gather(
+                *[_scrape_model(model, pools, force_refresh) for model in models],
+                return_exceptions=True
+            )
+        for model, result in zip(models, results):
+            if isinstance(result, Exception):
+                error_msg = f"Error scraping {model['make']} {model['model']}: {str(result)}"
+                print(error_msg)
+                scrape_status["errors"].append(error_msg)
+
+        # Refresh the dashboard roll-up once all models are scraped
+        await refresh_model_stats()
+        _cache.pop("stats", None)
 
     finally:
         scrape_status["is_running"] = False
@@ -207,13 +288,17 @@ async def run_scrape(model_ids: list[int] = None):
 
 
 @app.post("/api/scrape")
-async def trigger_scrape(background_tasks: BackgroundTasks, model_id: Optional[int] = None):
-    """Trigger a manual scrape."""
+async def trigger_scrape(
+    background_tasks: BackgroundTasks,
+    model_id: Optional[int] = None,
+    force_refresh: bool = False
+):
+    """Trigger a manual scrape, reusing results scraped in the last 15 minutes unless force_refresh."""
     if scrape_status["is_running"]:
         raise HTTPException(status_code=409, detail="Scrape already in progress")
 
     model_ids = [model_id] if model_id else None
-    background_tasks.add_task(run_scrape, model_ids)
+    background_tasks.add_task(run_scrape, model_ids, force_refresh)
 
     return {"message": "Scrape started", "status": scrape_status}
 
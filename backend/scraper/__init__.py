@@ -1,6 +1,6 @@
-from .base import BaseScraper
+from .base import BaseScraper, ScraperPool, close_browser, close_http_client
 from .cargurus import CarGurusScraper
 from .autotrader import AutotraderScraper
 from .carscom import CarsComScraper
 
-__all__ = ["BaseScraper", "CarGurusScraper", "AutotraderScraper", "CarsComScraper"]
+__all__ = ["BaseScraper", "ScraperPool", "CarGurusScraper", "AutotraderScraper", "CarsComScraper", "close_browser", "close_http_client"]
@@ -1,6 +1,8 @@
 import re
 from typing import AsyncGenerator
-from .base import BaseScraper, ListingData
+from .base import BaseScraper, BrowserUnavailableError, ListingData
+
+LISTING_ID_RE = re.compile(r"/(\d+)(?:\?|$)")
 
 
 class AutotraderScraper(BaseScraper):
@@ -45,6 +47,27 @@ class AutotraderScraper(BaseScraper):
         "ID.4": "ID4",
     }
 
+    CARD_SELECTOR = '[data-testid="listing-card"], .inventory-listing, [class*="ListingCard"]'
+
+    # Returns the fields of up to 30 listing cards, trying each card selector in turn
+    EXTRACT_CARDS_JS = """() => {
+        const cardSelectors = ['[data-testid="listing-card"]', '.inventory-listing', '[class*="ListingCard"]'];
+        const text = (card, sel) => card.querySelector(sel)?.innerText ?? null;
+        for (const sel of cardSelectors) {
+            const cards = [...document.querySelectorAll(sel)].slice(0, 30);
+            if (!cards.length) continue;
+            return cards.map(card => ({
+                id: card.getAttribute('data-listing-id') || card.getAttribute('id'),
+                price: text(card, '[data-testid="listing-price"], .first-price, [class*="Price"]'),
+                title: text(card, '[data-testid="listing-title"], .text-bold, h2, h3'),
+                mileage: text(card, '[data-testid="listing-mileage"], .text-muted, [class*="mileage"]'),
+                location: text(card, '[data-testid="listing-location"], .dealer-name, [class*="Location"]'),
+                href: card.querySelector('a[href*="/cars-for-sale/"]')?.getAttribute('href') ?? null,
+            }));
+        }
+        return [];
+    }"""
+
     def build_search_url(self, make: str, model: str) -> str:
         """Build Autotrader search URL."""
         make_slug = self.MAKE_SLUGS.get(make, make.upper())
@@ -62,78 +85,68 @@ class AutotraderScraper(BaseScraper):
         print(f"[Autotrader] Scraping {make} {model}: {url}")
 
         try:
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await self.random_delay(2, 4)
+            page = await self.get_page()
+            await page.goto(url, wait_until="commit", timeout=30000)
 
             # Wait for listings to load
-            await self.page.wait_for_selector('[data-testid="listing-card"], .inventory-listing, [class*="ListingCard"]', timeout=15000)
+            await page.wait_for_selector(self.CARD_SELECTOR, timeout=20000)
 
             # Scroll to load more listings
-            await self.scroll_page(3)
+            await self.scroll_page(self.CARD_SELECTOR, 3)
 
-            # Try multiple selectors for listing cards
-            listings = await self.page.query_selector_all('[data-testid="listing-card"]')
-            if not listings:
-                listings = await self.page.query_selector_all('.inventory-listing')
-            if not listings:
-                listings = await self.page.query_selector_all('[class*="ListingCard"]')
+            # Read every card's fields in a single round-trip to the browser
+            cards = await page.evaluate(self.EXTRACT_CARDS_JS)
 
-            print(f"[Autotrader] Found {len(listings)} listings for {make} {model}")
+            print(f"[Autotrader] Found {len(cards)} listings for {make} {model}")
 
-            for listing in listings[:30]:  # Limit to 30 per scrape
+            for card in cards:
                 try:
-                    listing_data = await self._parse_listing(listing)
+                    listing_data = self._parse_listing(card)
                     if listing_data and listing_data.price > 5000:
                         yield listing_data
                 except Exception as e:
                     print(f"[Autotrader] Error parsing listing: {e}")
                     continue
 
+        except BrowserUnavailableError:
+            raise  # Reported by the caller, unlike per-page failures
         except Exception as e:
             print(f"[Autotrader] Error scraping {make} {model}: {e}")
 
-    async def _parse_listing(self, listing) -> ListingData:
-        """Parse a single listing element."""
-        # Try to get listing ID from data attribute or link
-        external_id = await listing.get_attribute("data-listing-id")
-        if not external_id:
-            external_id = await listing.get_attribute("id")
+    def _parse_listing(self, card: dict) -> ListingData:
+        """Parse a single listing card extracted by EXTRACT_CARDS_JS."""
+        # Listing ID from data attribute or element id
+        external_id = card.get("id")
 
         # Get price
-        price_el = await listing.query_selector('[data-testid="listing-price"], .first-price, [class*="Price"]')
-        price_text = await price_el.inner_text() if price_el else ""
+        price_text = card.get("price") or ""
         price = self.parse_price(price_text)
 
         if price == 0:
             return None
 
         # Get title
-        title_el = await listing.query_selector('[data-testid="listing-title"], .text-bold, h2, h3')
-        title_text = await title_el.inner_text() if title_el else ""
+        title_text = card.get("title") or ""
         year = self.parse_year(title_text)
 
         # Get mileage
-        mileage_el = await listing.query_selector('[data-testid="listing-mileage"], .text-muted, [class*="mileage"]')
-        mileage_text = await mileage_el.inner_text() if mileage_el else ""
-        mileage = self.parse_mileage(mileage_text)
+        mileage = self.parse_mileage(card.get("mileage") or "")
 
         # Get location
-        location_el = await listing.query_selector('[data-testid="listing-location"], .dealer-name, [class*="Location"]')
-        location = await location_el.inner_text() if location_el else None
+        location = card.get("location")
 
         # Get URL
-        link_el = await listing.query_selector('a[href*="/cars-for-sale/"]')
-        href = await link_el.get_attribute("href") if link_el else ""
+        href = card.get("href") or ""
         url = f"{self.BASE_URL}{href}" if href and not href.startswith("http") else href
 
         if not external_id and url:
             # Extract ID from URL
-            match = re.search(r"/(\d+)(?:\?|$)", url)
+            match = LISTING_ID_RE.search(url)
             if match:
                 external_id = match.group(1)
 
         if not external_id:
-            external_id = f"at-{hash(title_text + str(price)) % 100000}"
+            external_id = f"at-{self.stable_id(title_text + str(price))}"
 
         return ListingData(
             external_id=external_id,
@@ -1,8 +1,166 @@
 import asyncio
-import random
+import re
+import time
+from hashlib import blake2b
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
-from playwright.async_api import async_playwright, Page, Browser
+
+import httpx
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+_DIGIT_RE = re.compile(r"\D+")
+_YEAR_RE = re.compile(r"20[0-2]\d")
+
+# Price, mileage, location and year alternatives, scanned in a single pass over card text
+FIELD_RE = re.compile(
+    r"(?P<price>\$[\d,]+)"
+    r"|(?P<mileage>[\d,]+)\s*[mM][iI]"
+    r"|(?P<location>[A-Z][a-z]+(?:\s[A-Z][a-z]+)*,\s*[A-Z]{2})"
+    r"|(?P<year>20[0-2]\d)"
+)
+_LOCATION_RE = re.compile(r"[A-Z][a-z]+(?:\s[A-Z][a-z]+)*,\s*[A-Z]{2}")
+
+
+def _digits(text: str) -> str:
+    """Strip everything but digits from text."""
+    # Regex matches like "$35,990" or "12,345" only need their separators removed,
+    # which str methods do faster than a regex substitution
+    cleaned = text.replace(",", "").lstrip("$")
+    if cleaned.isdecimal():
+        return cleaned
+    return _DIGIT_RE.sub("", text)
+
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0"
+
+# Resources the scrapers never read; aborting them keeps page loads light
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+)
+
+# Cacheable static subresources shared across scraper contexts, least recently used first:
+# {url: (expires_at, status, headers, body)}
+_response_cache: OrderedDict[str, tuple] = OrderedDict()
+_response_cache_bytes = 0
+RESPONSE_CACHE_MAX_ENTRIES = 500
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHED_RESOURCE_TYPES = frozenset({"script"})
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+# Dropped from cached headers: the stored body is already decoded, and cookies
+# must never be replayed into another context
+_UNCACHED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "set-cookie"})
+
+
+def _cache_ttl(headers: dict) -> int:
+    """Get how long a response may be shared across contexts, from its headers."""
+    cache_control = headers.get("cache-control")
+    if not cache_control or any(
+        directive in cache_control for directive in ("no-store", "no-cache", "private")
+    ):
+        return 0
+    # Responses varying on request headers can't be keyed by URL alone; Accept-Encoding
+    # is the exception since the body is stored decoded
+    if headers.get("vary", "accept-encoding").strip().lower() != "accept-encoding":
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def _uncache_response(url: str):
+    """Drop a response from the cache."""
+    global _response_cache_bytes
+    entry = _response_cache.pop(url, None)
+    if entry:
+        _response_cache_bytes -= len(entry[3])
+
+
+def _cache_response(url: str, entry: tuple):
+    """Cache a response, evicting the least recently used ones to stay within the limits."""
+    global _response_cache_bytes
+    if len(entry[3]) > RESPONSE_CACHE_MAX_BYTES:
+        return
+    _uncache_response(url)
+    _response_cache[url] = entry
+    _response_cache_bytes += len(entry[3])
+    while (
+        len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES
+        or _response_cache_bytes > RESPONSE_CACHE_MAX_BYTES
+    ):
+        _, evicted = _response_cache.popitem(last=False)
+        _response_cache_bytes -= len(evicted[3])
+
+
+# Recent scrape results, so repeat searches skip the browser entirely:
+# {(source, make, model, zip_code, radius): (expires_at, listings)}
+_listings_cache: dict[tuple, tuple[float, list]] = {}
+LISTINGS_CACHE_TTL = 15 * 60
+
+
+# Shared Playwright browser, launched on first use and reused by every scraper
+_pw = None
+_browser: Browser = None
+_browser_lock = asyncio.Lock()
+
+
+async def get_browser() -> Browser:
+    """Get the shared browser, launching it on first use or after it disconnects."""
+    global _pw, _browser
+    if _browser is None or not _browser.is_connected():
+        async with _browser_lock:
+            if _browser is None or not _browser.is_connected():
+                if _pw is None:
+                    _pw = await async_playwright().start()
+                _browser = await _pw.firefox.launch(headless=True)
+    return _browser
+
+
+async def close_browser():
+    """Close the shared browser and stop Playwright."""
+    global _pw, _browser
+    async with _browser_lock:
+        if _browser:
+            await _browser.close()
+            _browser = None
+        if _pw:
+            await _pw.stop()
+            _pw = None
+
+
+# Shared HTTP client for static page fetches, so connections are reused
+_http_client: httpx.AsyncClient = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+            timeout=15.0
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class BrowserUnavailableError(Exception):
+    """Raised when a scraper can't open a browser context to render a page."""
 
 
 class ListingData:
@@ -37,36 +195,103 @@ class BaseScraper(ABC):
         self.zip_code = zip_code
         self.radius = radius
         self.browser: Browser = None
+        self.context: BrowserContext = None
         self.page: Page = None
 
     async def __aenter__(self):
-        """Set up browser context."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.firefox.launch(
-            headless=True
-        )
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0"
-        )
-        self.page = await self.context.new_page()
+        """Set up the scraper; its browser context is opened on first use."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Clean up browser context."""
-        if self.page:
-            await self.page.close()
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
-
-    async def random_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0):
-        """Add random delay to avoid detection."""
-        delay = random.uniform(min_seconds, max_seconds)
-        await asyncio.sleep(delay)
+        await self.close()
+
+    async def get_page(self) -> Page:
+        """Get this scraper's page, opening a browser context on first use."""
+        if self.page is None:
+            try:
+                self.browser = await get_browser()
+                self.context = await self.browser.new_context(
+                    viewport={"width": 1920, "height": 1080},
+                    user_agent=USER_AGENT
+                )
+                await self.context.route("**/*", self._route_handler)
+                self.page = await self.context.new_page()
+            except Exception as e:
+                # Launch failures aren't always Playwright errors (e.g. a missing driver)
+                await self.close()
+                raise BrowserUnavailableError(f"Could not open a browser page: {e}") from e
+        return self.page
+
+    async def close(self):
+        """Close the browser context, if one was opened."""
+        context, self.context, self.page = self.context, None, None
+        if context:
+            try:
+                await context.close()
+            except PlaywrightError:
+                pass  # Already gone along with its browser
+
+    async def reset_page(self):
+        """Blank the page between scrapes so a pooled scraper can be reused."""
+        if self.page is None:
+            return
+        try:
+            await self.page.goto("about:blank")
+        except PlaywrightError:
+            # The page or its context is broken; drop both so the next
+            # scrape opens a fresh context
+            await self.close()
+
+    async def _route_handler(self, route):
+        """Abort unneeded resources and serve static scripts from the shared response cache."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            host in request.url for host in BLOCKED_HOSTS
+        ):
+            await route.abort()
+            return
+
+        # Documents, XHR and everything else go through the browser's own network stack
+        if request.method != "GET" or request.resource_type not in CACHED_RESOURCE_TYPES:
+            await route.continue_()
+            return
+
+        now = time.monotonic()
+        cached = _response_cache.get(request.url)
+        if cached and cached[0] > now:
+            _response_cache.move_to_end(request.url)
+            _, status, headers, body = cached
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+        if cached:
+            _uncache_response(request.url)
+
+        try:
+            response = await route.fetch()
+        except PlaywrightError:
+            await route.abort()
+            return
+
+        ttl = _cache_ttl(response.headers)
+        if 200 <= response.status < 300 and ttl:
+            headers = {
+                name: value for name, value in response.headers.items()
+                if name not in _UNCACHED_HEADERS
+            }
+            _cache_response(request.url, (now + ttl, response.status, headers, await response.body()))
+
+        await route.fulfill(response=response)
+
+    async def _fetch_static(self, url: str) -> str:
+        """Fetch a page's server-rendered HTML, or "" if the request fails."""
+        try:
+            response = await get_http_client().get(url)
+            response.raise_for_status()
+            return response.text
+        except httpx.HTTPError as e:
+            print(f"[{self.SOURCE_NAME}] Static fetch failed for {url}: {e}")
+            return ""
 
     @abstractmethod
     def build_search_url(self, make: str, model: str) -> str:
@@ -78,40 +303,147 @@ class BaseScraper(ABC):
         """Scrape listings for a specific make/model."""
         pass
 
-    async def scroll_page(self, scroll_count: int = 3):
-        """Scroll down the page to load lazy content."""
+    async def scrape(
+        self,
+        make: str,
+        model: str,
+        force_refresh: bool = False
+    ) -> tuple[list[ListingData], bool]:
+        """Scrape listings for a make/model, reusing results from the last 15 minutes.
+
+        Returns (listings, from_cache), so callers can skip re-saving listings
+        that were already stored by the scrape that cached them.
+        """
+        key = (self.SOURCE_NAME, make, model, self.zip_code, self.radius)
+        now = time.monotonic()
+        cached = _listings_cache.get(key)
+        if cached and cached[0] > now and not force_refresh:
+            print(f"[{self.SOURCE_NAME}] Using cached listings for {make} {model}")
+            return list(cached[1]), True
+
+        listings = [listing async for listing in self.scrape_listings(make, model)]
+        # Empty results usually mean a blocked or failed scrape, so don't keep them
+        if listings:
+            _listings_cache[key] = (now + LISTINGS_CACHE_TTL, listings)
+        else:
+            _listings_cache.pop(key, None)
+        return listings, False
+
+    async def scroll_page(self, selector: str, scroll_count: int = 3, target: int = 30):
+        """Scroll down the page to load lazy content.
+
+        Each pass waits for more elements matching selector to appear instead
+        of sleeping for a fixed delay, and scrolling stops once target elements
+        have loaded or the count is unchanged for two passes in a row.
+        """
+        count_js = "(sel) => document.querySelectorAll(sel).length"
+        count = await self.page.evaluate(count_js, selector)
+        unchanged = 0
         for _ in range(scroll_count):
-            await self.page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await self.random_delay(0.5, 1.0)
+            if count >= target or unchanged >= 2:
+                break
+            await self.page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+            try:
+                await self.page.wait_for_function(
+                    "([sel, count]) => document.querySelectorAll(sel).length > count",
+                    arg=[selector, count],
+                    timeout=1500
+                )
+            except PlaywrightTimeoutError:
+                pass
+            new_count = await self.page.evaluate(count_js, selector)
+            unchanged = unchanged + 1 if new_count == count else 0
+            count = new_count
+
+    def stable_id(self, text: str) -> str:
+        """Build a fallback listing ID that stays the same across processes."""
+        return blake2b(text.encode(), digest_size=8).hexdigest()
+
+    def extract_fields(self, text: str) -> tuple:
+        """Find the first price, mileage, location and year strings in listing text."""
+        fields = {}
+        for match in FIELD_RE.finditer(text):
+            fields.setdefault(match.lastgroup, match.group(match.lastgroup))
+            if len(fields) == 4:
+                break
+
+        # A mileage match can swallow the start of a city ("12 Miami, FL") or
+        # the year before a model name ("2022 Mini"), so retry those on their own
+        location = fields.get("location")
+        if location is None:
+            location_match = _LOCATION_RE.search(text)
+            location = location_match.group() if location_match else None
+
+        year = fields.get("year")
+        if year is None:
+            year_match = _YEAR_RE.search(text)
+            year = year_match.group() if year_match else None
+
+        return fields.get("price"), fields.get("mileage"), location, year
 
     def parse_price(self, price_text: str) -> int:
         """Parse price string to integer."""
         if not price_text:
             return 0
         # Remove currency symbols, commas, and whitespace
-        cleaned = "".join(c for c in price_text if c.isdigit())
-        try:
-            return int(cleaned)
-        except ValueError:
-            return 0
+        return int(_digits(price_text) or 0)
 
     def parse_mileage(self, mileage_text: str) -> int:
         """Parse mileage string to integer."""
         if not mileage_text:
             return None
-        cleaned = "".join(c for c in mileage_text if c.isdigit())
-        try:
-            return int(cleaned)
-        except ValueError:
-            return None
+        cleaned = _digits(mileage_text)
+        return int(cleaned) if cleaned else None
 
     def parse_year(self, year_text: str) -> int:
         """Parse year from text."""
         if not year_text:
             return None
         # Look for 4-digit year
-        import re
-        match = re.search(r"20[0-2]\d", year_text)
+        match = _YEAR_RE.search(year_text)
         if match:
             return int(match.group())
         return None
+
+
+class ScraperPool:
+    """A bounded pool of reusable scrapers for one source.
+
+    Scrapers are created on demand, up to max_size, and each only opens a
+    browser context once a scrape misses both the listings cache and the
+    static HTML path.
+    """
+
+    def __init__(self, scraper_class: type, zip_code: str, radius: int, max_size: int = 5):
+        self.scraper_class = scraper_class
+        self.zip_code = zip_code
+        self.radius = radius
+        self.max_size = max_size
+        self._scrapers: list[BaseScraper] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close every scraper's browser context."""
+        for scraper in self._scrapers:
+            await scraper.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[BaseScraper, None]:
+        """Borrow an idle scraper, waiting for one if all are busy."""
+        if self._idle.empty() and len(self._scrapers) < self.max_size:
+            scraper = self.scraper_class(zip_code=self.zip_code, radius=self.radius)
+            self._scrapers.append(scraper)
+        else:
+            scraper = await self._idle.get()
+
+        try:
+            yield scraper
+        finally:
+            # Always hand the scraper back, even if blanking its page failed
+            try:
+                await scraper.reset_page()
+            finally:
+                self._idle.put_nowait(scraper)
@@ -1,7 +1,10 @@
-import re
 from typing import AsyncGenerator
 from urllib.parse import quote
-from .base import BaseScraper, ListingData
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from selectolax.parser import HTMLParser
+
+from .base import BaseScraper, BrowserUnavailableError, ListingData
 
 
 class CarGurusScraper(BaseScraper):
@@ -10,6 +13,18 @@ class CarGurusScraper(BaseScraper):
     SOURCE_NAME = "cargurus"
     BASE_URL = "https://www.cargurus.com"
 
+    # Selectors for listing cards, most specific first
+    CARD_SELECTORS = (
+        'article[data-cg-ft="car-blade"]',
+        '[data-testid="srp-tile-wrapper"]',
+        '.cg-dealFinder-result-wrap',
+    )
+    FALLBACK_SELECTORS = (
+        'article',
+        'div[class*="listing"]',
+        'a[href*="/Cars/"][href*="VIN"]',
+    )
+
     def build_search_url(self, make: str, model: str) -> str:
         """Build CarGurus search URL using text search."""
         # Use the Cars search page with make/model in the URL path
@@ -28,45 +43,29 @@ class CarGurusScraper(BaseScraper):
         print(f"[CarGurus] Scraping {make} {model}: {url}")
 
         try:
-            await self.page.goto(url, wait_until="networkidle", timeout=45000)
-            await self.random_delay(2, 3)
-
-            # Scroll to load more listings
-            await self.scroll_page(2)
-            await self.random_delay(1, 2)
-
-            # Get page content to analyze
-            content = await self.page.content()
-
-            # Find all listing links with prices using regex on page content
-            # Pattern for listing URLs and prices
-            listing_pattern = r'href="(/Cars/[^"]*VIN[^"]*)"[^>]*>.*?(\$[\d,]+)'
-
-            # Try multiple selectors for listing cards
-            selectors = [
-                'article[data-cg-ft="car-blade"]',
-                '[data-testid="srp-tile-wrapper"]',
-                '.cg-dealFinder-result-wrap',
-                'article',
-                'div[class*="listing"]',
-                'a[href*="/Cars/"][href*="VIN"]'
-            ]
-
-            listings = []
-            for selector in selectors:
-                listings = await self.page.query_selector_all(selector)
-                if listings:
-                    print(f"[CarGurus] Found {len(listings)} elements with selector: {selector}")
-                    break
-
-            if not listings:
+            # Fast path: parse the server-rendered HTML without a browser
+            rows = []
+            html = await self._fetch_static(url)
+            if html:
+                rows = self._extract_rows(html, self.CARD_SELECTORS)
+                if rows:
+                    print(f"[CarGurus] Found {len(rows)} listings in static HTML")
+
+            if not rows:
+                rows = await self._extract_rendered_rows(url)
+
+            if not rows:
                 print(f"[CarGurus] No listings found for {make} {model}")
                 return
 
+            # Lowercased make and first model word, checked against every card
+            make_lower = make.lower()
+            model_token = model.lower().split()[0]
+
             count = 0
-            for listing in listings[:30]:  # Limit to 30 per scrape
+            for row in rows:
                 try:
-                    listing_data = await self._parse_listing(listing, make, model)
+                    listing_data = self._parse_row(row, make_lower, model_token)
                     if listing_data and listing_data.price > 5000:
                         count += 1
                         yield listing_data
@@ -75,58 +74,90 @@ class CarGurusScraper(BaseScraper):
 
             print(f"[CarGurus] Scraped {count} valid listings for {make} {model}")
 
+        except BrowserUnavailableError:
+            raise  # Reported by the caller, unlike per-page failures
         except Exception as e:
             print(f"[CarGurus] Error scraping {make} {model}: {e}")
 
-    async def _parse_listing(self, listing, make: str, model: str) -> ListingData:
-        """Parse a single listing element."""
+    def _extract_rows(self, html: str, selectors: tuple[str, ...]) -> list[dict]:
+        """Extract up to 30 listing rows from HTML using the first selector that matches."""
+        tree = HTMLParser(html)
+        for selector in selectors:
+            nodes = tree.css(selector)[:30]
+            if not nodes:
+                continue
+            rows = []
+            for node in nodes:
+                link = node.css_first('a[href*="/Cars/"]') or node
+                rows.append({
+                    "text": node.text(separator="\n", strip=True),
+                    "id": node.attributes.get("data-listing-id") or node.attributes.get("id"),
+                    "href": link.attributes.get("href"),
+                })
+            return rows
+        return []
+
+    async def _extract_rendered_rows(self, url: str) -> list[dict]:
+        """Load the page in the browser and extract listing rows from the DOM."""
+        page = await self.get_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+
+        # Wait for listing cards rather than for the whole page to go idle
+        card_selector = ", ".join(self.CARD_SELECTORS)
         try:
-            text_content = await listing.inner_text()
-        except:
+            await page.wait_for_selector(card_selector, timeout=8000)
+        except PlaywrightTimeoutError:
+            pass  # The looser fallback selectors below may still match
+
+        # Scroll until 30 cards have loaded or no more appear
+        await self.scroll_page(card_selector, 5)
+
+        # Parse the rendered DOM once in Python, trying the card selectors
+        # first and then progressively looser ones
+        rows = self._extract_rows(
+            await page.content(), (*self.CARD_SELECTORS, *self.FALLBACK_SELECTORS)
+        )
+        if rows:
+            print(f"[CarGurus] Found {len(rows)} listings in rendered page")
+        return rows
+
+    def _parse_row(self, row: dict, make_lower: str, model_token: str) -> ListingData:
+        """Parse a single extracted listing row."""
+        text_content = row.get("text")
+        if not text_content:
             return None
 
         # Skip if doesn't look like a car listing
         if len(text_content) < 20:
             return None
 
+        # Verify this listing is for the right make/model before any parsing
+        text_lower = text_content.lower()
+        if make_lower not in text_lower or model_token not in text_lower:
+            return None
+
         # Try to get listing ID
-        external_id = await listing.get_attribute("data-listing-id")
+        external_id = row.get("id")
         if not external_id:
-            external_id = await listing.get_attribute("id")
-        if not external_id:
-            external_id = f"cg-{abs(hash(text_content)) % 100000}"
+            external_id = f"cg-{self.stable_id(text_content)}"
 
-        # Extract price from text
-        price_match = re.search(r'\$[\d,]+', text_content)
-        price = self.parse_price(price_match.group()) if price_match else 0
+        # Extract price, mileage, location and year from text in one pass
+        price_text, mileage_text, location, year_text = self.extract_fields(text_content)
+        price = self.parse_price(price_text)
 
         if price == 0 or price > 500000:  # Sanity check
             return None
 
         # Extract year
-        year = self.parse_year(text_content)
-
-        # Verify this listing is for the right make/model
-        text_lower = text_content.lower()
-        if make.lower() not in text_lower or model.lower().split()[0] not in text_lower:
-            return None
+        year = self.parse_year(year_text)
 
         # Extract mileage
-        mileage_match = re.search(r'([\d,]+)\s*mi', text_content, re.IGNORECASE)
-        mileage = self.parse_mileage(mileage_match.group(1)) if mileage_match else None
+        mileage = self.parse_mileage(mileage_text)
 
         # Get URL
-        link_el = await listing.query_selector('a[href*="/Cars/"]')
-        if not link_el:
-            link_el = listing if await listing.get_attribute("href") else None
-
-        href = await link_el.get_attribute("href") if link_el else ""
+        href = row.get("href") or ""
         url = f"{self.BASE_URL}{href}" if href and not href.startswith("http") else href
 
-        # Extract location if present
-        location_match = re.search(r'([A-Z][a-z]+(?:\s[A-Z][a-z]+)*,\s*[A-Z]{2})', text_content)
-        location = location_match.group(1) if location_match else None
-
         return ListingData(
             external_id=external_id,
             price=price,
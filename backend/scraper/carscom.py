@@ -1,6 +1,14 @@
 import re
+from functools import lru_cache
 from typing import AsyncGenerator
-from .base import BaseScraper, ListingData
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from selectolax.parser import HTMLParser
+
+from .base import BaseScraper, BrowserUnavailableError, ListingData
+
+VEHICLEDETAIL_ID_RE = re.compile(r'/vehicledetail/([^/]+)/')
+VEHICLEDETAIL_LINK_SELECTOR = 'a[href*="/vehicledetail/"]'
 
 
 class CarsComScraper(BaseScraper):
@@ -49,14 +57,22 @@ class CarsComScraper(BaseScraper):
         ("Polestar", "4"): "polestar-4",
     }
 
-    def build_search_url(self, make: str, model: str) -> str:
-        """Build Cars.com search URL."""
-        make_slug = self.MAKE_SLUGS.get(make, make.lower())
-        model_slug = self.MODEL_SLUGS.get((make, model))
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _slugs_for(cls, make: str, model: str) -> tuple[str, str]:
+        """Get the (make, model) URL slugs, computed once per pair."""
+        make_slug = cls.MAKE_SLUGS.get(make, make.lower())
+        model_slug = cls.MODEL_SLUGS.get((make, model))
 
         if not model_slug:
             model_slug = f"{make_slug}-{model.lower().replace(' ', '_').replace('-', '_').replace('.', '_')}"
 
+        return make_slug, model_slug
+
+    def build_search_url(self, make: str, model: str) -> str:
+        """Build Cars.com search URL."""
+        make_slug, model_slug = self._slugs_for(make, model)
+
         return (
             f"{self.BASE_URL}/shopping/results/"
             f"?stock_type=used&makes[]={make_slug}&models[]={model_slug}"
@@ -69,88 +85,116 @@ class CarsComScraper(BaseScraper):
         print(f"[Cars.com] Scraping {make} {model}: {url}")
 
         try:
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await self.random_delay(2, 4)
-
-            # Scroll to load more listings
-            await self.scroll_page(2)
-
-            # Find vehicle detail links and get their parent containers
-            links = await self.page.query_selector_all('a[href*="/vehicledetail/"]')
-            print(f"[Cars.com] Found {len(links)} vehicle links for {make} {model}")
-
-            seen_ids = set()
+            # Fast path: parse the server-rendered HTML without a browser
+            rows = []
+            html = await self._fetch_static(url)
+            if html:
+                rows = self._extract_rows(html)
+                if rows:
+                    print(f"[Cars.com] Found {len(rows)} listings in static HTML for {make} {model}")
+
+            if not rows:
+                rows = await self._extract_rendered_rows(url, make, model)
+
+            make_lower = make.lower()
             count = 0
+            for row in rows:
+                listing_data = self._parse_listing_text(row["text"], row["id"], row["href"], make_lower)
+                if listing_data and listing_data.price > 5000:
+                    count += 1
+                    yield listing_data
+                    if count >= 30:
+                        break
 
-            for link in links[:60]:  # Check more links, filter dupes
-                try:
-                    href = await link.get_attribute("href")
-                    if not href:
-                        continue
-
-                    # Extract listing ID from URL
-                    id_match = re.search(r'/vehicledetail/([^/]+)/', href)
-                    if not id_match:
-                        continue
-
-                    external_id = id_match.group(1)
-                    if external_id in seen_ids:
-                        continue
-                    seen_ids.add(external_id)
-
-                    # Get the parent container with listing info
-                    # Go up several levels to find the card container
-                    parent = await link.evaluate_handle("el => el.closest('div[class*=\"vehicle\"], div[class*=\"listing\"], section, article') || el.parentElement.parentElement.parentElement")
-
-                    if not parent:
-                        continue
+            print(f"[Cars.com] Scraped {count} valid listings for {make} {model}")
 
-                    text_content = await parent.evaluate("el => el.innerText")
-                    if not text_content or len(text_content) < 20:
-                        continue
+        except BrowserUnavailableError:
+            raise  # Reported by the caller, unlike per-page failures
+        except Exception as e:
+            print(f"[Cars.com] Error scraping {make} {model}: {e}")
 
-                    listing_data = self._parse_listing_text(text_content, external_id, href, make)
-                    if listing_data and listing_data.price > 5000:
-                        count += 1
-                        yield listing_data
-                        if count >= 30:
-                            break
+    def _extract_rows(self, html: str) -> list[dict]:
+        """Extract listing rows from page HTML, one per vehicle detail link."""
+        rows = []
+        seen_ids = set()
+
+        for link in HTMLParser(html).css(VEHICLEDETAIL_LINK_SELECTOR)[:60]:
+            href = link.attributes.get("href")
+            if not href:
+                continue
+
+            id_match = VEHICLEDETAIL_ID_RE.search(href)
+            if not id_match or id_match.group(1) in seen_ids:
+                continue
+            seen_ids.add(id_match.group(1))
+
+            # Walk up to the enclosing card container
+            container = link.parent
+            while container is not None and not self._is_card_container(container):
+                container = container.parent
+            if container is None:
+                container = link.parent and link.parent.parent and link.parent.parent.parent
+            if container is None:
+                continue
+
+            text = container.text(separator="\n", strip=True)
+            if len(text) >= 20:
+                rows.append({"id": id_match.group(1), "href": href, "text": text})
+
+        return rows
+
+    @staticmethod
+    def _is_card_container(node) -> bool:
+        """Match div[class*="vehicle"], div[class*="listing"], section or article."""
+        if node.tag in ("section", "article"):
+            return True
+        if node.tag == "div":
+            css_class = node.attributes.get("class") or ""
+            return "vehicle" in css_class or "listing" in css_class
+        return False
+
+    async def _extract_rendered_rows(self, url: str, make: str, model: str) -> list[dict]:
+        """Load the page in the browser and extract listing rows from the DOM."""
+        page = await self.get_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+        # Wait for the first listings rather than sleeping for a fixed delay
+        try:
+            await page.wait_for_selector(VEHICLEDETAIL_LINK_SELECTOR, timeout=8000)
+        except PlaywrightTimeoutError:
+            pass  # An empty result is handled by the caller
 
-                except Exception as e:
-                    continue
+        # Scroll until enough links have loaded (up to two per card) or no more appear
+        await self.scroll_page(VEHICLEDETAIL_LINK_SELECTOR, 5, target=60)
 
-            print(f"[Cars.com] Scraped {count} valid listings for {make} {model}")
+        # Parse the rendered DOM once in Python rather than querying it per card
+        rows = self._extract_rows(await page.content())
+        print(f"[Cars.com] Found {len(rows)} vehicle listings for {make} {model}")
 
-        except Exception as e:
-            print(f"[Cars.com] Error scraping {make} {model}: {e}")
+        return rows
 
-    def _parse_listing_text(self, text: str, external_id: str, href: str, make: str) -> ListingData:
+    def _parse_listing_text(self, text: str, external_id: str, href: str, make_lower: str) -> ListingData:
         """Parse listing data from text content."""
-        # Extract price
-        price_match = re.search(r'\$[\d,]+', text)
-        price = self.parse_price(price_match.group()) if price_match else 0
+        # Verify it's the right make before any parsing
+        if make_lower not in text.lower():
+            return None
+
+        # Extract price, mileage, location and year in one pass
+        price_text, mileage_text, location, year_text = self.extract_fields(text)
+        price = self.parse_price(price_text)
 
         if price == 0 or price > 500000:
             return None
 
         # Extract year
-        year = self.parse_year(text)
-
-        # Verify it's the right make
-        if make.lower() not in text.lower():
-            return None
+        year = self.parse_year(year_text)
 
         # Extract mileage
-        mileage_match = re.search(r'([\d,]+)\s*mi', text, re.IGNORECASE)
-        mileage = self.parse_mileage(mileage_match.group(1)) if mileage_match else None
+        mileage = self.parse_mileage(mileage_text)
 
         # Build URL
         url = f"{self.BASE_URL}{href}" if not href.startswith("http") else href
 
-        # Extract location
-        location_match = re.search(r'([A-Z][a-z]+(?:\s[A-Z][a-z]+)*,\s*[A-Z]{2})', text)
-        location = location_match.group(1) if location_match else None
-
         return ListingData(
             external_id=external_id,
             price=price,